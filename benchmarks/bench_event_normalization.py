@@ -0,0 +1,123 @@
+# Benchmark: bulk event normalization vs. the original per-event loop in fetch_events_data
+#
+# Run from the repository root:
+#     python benchmarks/bench_event_normalization.py --events 5000 --weeks 52
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main # noqa: E402 (needs the repository root on sys.path)
+
+
+def legacy_normalize(events):
+    """The loop fetch_events_data used before normalize_events (UTC wall clock, no end time, no sorting)."""
+    for event in events:
+        if 'title' in event and event['title']:
+            event['title'] = main.strip_html_tags(event['title'])
+        if 'description' in event and event['description']:
+            event['description'] = main.strip_html_tags(event['description'])
+
+        if 'start_time' in event and event['start_time']:
+            try:
+                dt_obj = datetime.datetime.fromisoformat(event['start_time'].replace('Z', '+00:00'))
+                event['start_time_formatted'] = dt_obj.strftime("%A, %B %d, %Y at %I:%M %p")
+            except ValueError:
+                event['start_time_formatted'] = event['start_time']
+        else:
+            event['start_time_formatted'] = "Date/Time TBD"
+    return events
+
+
+def make_events(count, seed=42):
+    """
+    Builds 'count' synthetic PocketBase event records.
+    Like real data, most events are recurring: they share a small set of weekly time slots.
+    """
+    rng = random.Random(seed)
+    first_sabbath = datetime.datetime(2024, 1, 6, tzinfo=datetime.timezone.utc)
+    slots = [(14, 0, 60), (15, 30, 90), (23, 0, 120), (0, 30, 45)] # UTC hour, minute, duration in minutes
+    events = []
+    for i in range(count):
+        hour, minute, duration = rng.choice(slots)
+        start = first_sabbath + datetime.timedelta(weeks=rng.randrange(104), days=rng.randrange(7), hours=hour, minutes=minute)
+        end = start + datetime.timedelta(minutes=duration)
+        events.append({
+            'id': f"event{i}",
+            'title': f"<p>Event {i} &amp; fellowship</p>",
+            'description': "<p>Join us&nbsp;for <strong>worship</strong> and a potluck.</p>",
+            'start_time': start.strftime("%Y-%m-%d %H:%M:%S.000Z"),
+            'end_time': end.strftime("%Y-%m-%d %H:%M:%S.000Z"),
+            'location': "Fellowship Hall"
+        })
+    rng.shuffle(events)
+    return events
+
+
+def clear_caches():
+    """Empties the memoization caches used by normalize_events, as in a fresh process."""
+    main._format_event_times.cache_clear()
+    main._strip_event_html.cache_clear()
+
+
+def bulk_normalize(events, timezone_name):
+    """normalize_events plus grouping by day, as main_process uses them."""
+    return main.group_events_by_day(main.normalize_events(events, timezone_name))
+
+
+def run_single(function, events):
+    """One bulletin: all events normalized once."""
+    function([dict(event) for event in events])
+
+
+def run_batch(function, events, weeks):
+    """
+    Batch / archive backfill: one bulletin per week, each normalizing the events that have not
+    ended yet on that date (what fetch_events_data returns), so the same events recur every week.
+    """
+    first_sabbath = "2024-01-06"
+    for week in range(weeks):
+        bulletin_day = (datetime.date.fromisoformat(first_sabbath) + datetime.timedelta(weeks=week)).strftime("%Y-%m-%d")
+        function([dict(event) for event in events if event['end_time'] >= bulletin_day])
+
+
+def time_best(scenario, repeat, before_each=None):
+    """Returns the best wall-clock time in seconds of 'scenario' over 'repeat' runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        if before_each:
+            before_each()
+        started = time.perf_counter()
+        scenario()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark bulk event normalization against the original loop.")
+    parser.add_argument("--events", type=int, default=5000, help="Number of synthetic events. Defaults to 5000.")
+    parser.add_argument("--weeks", type=int, default=52, help="Weekly bulletins in the batch scenario. Defaults to 52.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant; the best is reported. Defaults to 5.")
+    parser.add_argument("--timezone", default=main.DEFAULT_TIMEZONE, help=f"Timezone for normalize_events. Defaults to {main.DEFAULT_TIMEZONE}.")
+    args = parser.parse_args()
+
+    events = make_events(args.events)
+    new_function = lambda evts: bulk_normalize(evts, args.timezone)
+    scenarios = [
+        ("single bulletin", lambda function: run_single(function, events)),
+        (f"batch of {args.weeks} bulletins", lambda function: run_batch(function, events, args.weeks)),
+    ]
+
+    print(f"{args.events} events, best of {args.repeat} runs (caches cleared before every run):")
+    for scenario_name, scenario in scenarios:
+        legacy_seconds = time_best(lambda: scenario(legacy_normalize), args.repeat)
+        new_seconds = time_best(lambda: scenario(new_function), args.repeat, before_each=clear_caches)
+        print(f"  {scenario_name}:")
+        print(f"    legacy loop (UTC, unsorted)              {legacy_seconds * 1000:9.2f} ms")
+        print(f"    normalize_events (tz, ranges, grouped)   {new_seconds * 1000:9.2f} ms  ({legacy_seconds / new_seconds:4.2f}x)")
+    print(f"  time cache: {main._format_event_times.cache_info()}")
@@ -5,37 +5,71 @@ import toml      # For reading config.toml
 import jinja2    # For HTML templating
 from weasyprint import HTML, CSS # For PDF generation
 import os
+import sys # For prefixing tenant log lines on stdout
 import datetime # For handling dates
 import argparse
 import re # Added for HTML stripping
 import html # For unescaping HTML entities like &nbsp;
+import json # For the pending upload outbox
+import random # For jittered retry backoff
+import time # For retry backoff sleeps and stage timings
+import threading # For serializing PDF writes on the shared renderer
+import concurrent.futures # For processing several church configs concurrently
+import sqlite3 # For the searchable archive index of past bulletins
+import functools # For memoizing event timestamp formatting
+import itertools # For grouping events by day
+import zoneinfo # For converting event times to the church's timezone
+from requests.adapters import HTTPAdapter # For sizing the shared per-host connection pools
+try:
+    import fcntl # For the exclusive run lock (POSIX only)
+except ImportError:
+    fcntl = None
 
 # --- Configuration ---
 CONFIG_PATH = "config.toml" # NOW LOCAL TO SCRIPT DIRECTORY
 TEMP_IMAGE_DIR = "temp_images"
 OUTPUT_DIR = "output" # For local PDF saving
 TEMPLATES_DIR = "templates" # Directory for Jinja2 templates, relative to main.py
+UPLOAD_OUTBOX_FILE = "upload_outbox.json" # Pending PDF uploads, kept inside OUTPUT_DIR
+UPLOAD_MAX_ATTEMPTS = 5 # Default attempts per upload, overridable via config 'upload_max_attempts'
+UPLOAD_RETRY_BASE_DELAY = 2.0 # Seconds, overridable via config 'upload_retry_base_delay'
+UPLOAD_RETRY_MAX_DELAY = 60.0 # Seconds, overridable via config 'upload_retry_max_delay'
+JOURNAL_DIR = "journal" # Per-date run journals and rendered HTML, kept inside OUTPUT_DIR
+RUN_LOCK_FILE = "bulletin.lock" # Exclusive lock held for the whole run, kept inside OUTPUT_DIR
+ARCHIVE_DB_FILE = "archive.sqlite3" # Full-text index of parsed bulletin items, kept inside OUTPUT_DIR
+ARCHIVE_SCHEMA_VERSION = 2 # Bump when the indexed row contents change; older archives are cleared
+DEFAULT_TIMEZONE = "America/New_York" # Timezone for event times, overridable via config 'timezone'
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>') # Compiled once, strip_html_tags runs for every event
+# Checkpointed stages of main_process, in execution order
+RUN_STAGES = ['fetch_bulletin', 'download_cover_image', 'fetch_events', 'parse', 'render_html', 'generate_pdf', 'upload']
 
 def strip_html_tags(text):
     """Removes HTML tags from a string and handles common entities like &nbsp;."""
     if not text:
         return ""
     # 1. Remove HTML tags
-    text_no_tags = re.sub(r'<[^>]+>', '', text)
+    text_no_tags = HTML_TAG_PATTERN.sub('', text)
     # 2. Unescape HTML entities (e.g., &nbsp; -> \xa0, &amp; -> &)
     text_unescaped = html.unescape(text_no_tags)
     # 3. Replace non-breaking space character (\xa0) with a regular space
     text_final = text_unescaped.replace('\xa0', ' ')
     return text_final
 
-def load_config():
-    """Loads configuration from config.toml."""
+def load_config(config_path=None):
+    """
+    Loads configuration from config.toml, or from 'config_path' if given.
+    A relative 'config_path' is resolved against the current working directory.
+    """
+    config_file_path = config_path
     try:
-        # Construct the absolute path to config.toml relative to main.py
-        # os.path.abspath ensures the path is correct regardless of where the script is run from,
-        # as long as config.toml maintains its relative position to the script.
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        config_file_path = os.path.join(script_dir, CONFIG_PATH)
+        if config_file_path:
+            config_file_path = os.path.abspath(config_file_path)
+        else:
+            # Construct the absolute path to config.toml relative to main.py
+            # os.path.abspath ensures the path is correct regardless of where the script is run from,
+            # as long as config.toml maintains its relative position to the script.
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            config_file_path = os.path.join(script_dir, CONFIG_PATH)
         
         with open(config_file_path, 'r') as f:
             config_data = toml.load(f)
@@ -83,6 +117,25 @@ def get_pocketbase_client(config):
     print(f"PocketBase client configured for URL: {pb_details['pocketbase_url']}")
     return pb_details
 
+def create_http_session(pool_size=10):
+    """
+    Creates a requests.Session whose connection pool can hold 'pool_size' connections per host.
+    Used to share keep-alive connections between tenants that talk to the same PocketBase host.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def get_http_client(pb_config):
+    """
+    Returns the object used for HTTP calls to PocketBase: the shared session stored under
+    'http_session' in the PocketBase configuration, or the plain requests module otherwise.
+    Both expose the same get/post/patch interface.
+    """
+    return pb_config.get('http_session') or requests
+
 def fetch_bulletin_data(pb_config, bulletin_date_str):
     """
     Fetches the bulletin record for the given date string (e.g., "YYYY-MM-DD").
@@ -117,7 +170,7 @@ def fetch_bulletin_data(pb_config, bulletin_date_str):
 
     try:
         print(f"Fetching bulletin data from: {api_url} with params: {params}")
-        response = requests.get(api_url, params=params)
+        response = get_http_client(pb_config).get(api_url, params=params)
         response.raise_for_status()  # Raise an exception for HTTP errors (4xx or 5xx)
         
         data = response.json()
@@ -170,7 +223,7 @@ def download_cover_image(pb_config, collection_id, record_id, image_field_name,
 
     try:
         print(f"Downloading cover image from: {file_url}")
-        response = requests.get(file_url, stream=True) # stream=True for potentially larger files
+        response = get_http_client(pb_config).get(file_url, stream=True) # stream=True for potentially larger files
         response.raise_for_status()
 
         with open(local_image_path, 'wb') as f:
@@ -191,28 +244,134 @@ def download_cover_image(pb_config, collection_id, record_id, image_field_name,
             os.remove(local_image_path) # Clean up partial download
         return None
 
-def fetch_events_data(pb_config, bulletin_date_obj):
+def get_event_timezone(timezone_name):
     """
-    Fetches all events and filters them based on end_time >= bulletin_date_obj.
+    Returns the ZoneInfo for 'timezone_name' (e.g., "America/New_York").
+    Falls back to UTC with a warning if the zone is unknown.
+    """
+    try:
+        return zoneinfo.ZoneInfo(timezone_name)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError) as e:
+        print(f"WARNING: Unknown timezone '{timezone_name}' ({e}). Event times will be shown in UTC.")
+        return datetime.timezone.utc
+
+def _parse_event_timestamp(raw_timestamp, tz):
+    """
+    Parses a PocketBase timestamp (e.g., "2024-03-15 10:00:00.000Z") and converts it to the zone 'tz'.
+    Timestamps without an offset are treated as UTC, which is how PocketBase stores them.
+    Returns an aware datetime, or None if it is missing or cannot be parsed.
+    """
+    if not raw_timestamp:
+        return None
+    try:
+        dt_obj = datetime.datetime.fromisoformat(raw_timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if dt_obj.tzinfo is None:
+        dt_obj = dt_obj.replace(tzinfo=datetime.timezone.utc)
+    return dt_obj.astimezone(tz)
+
+@functools.lru_cache(maxsize=65536)
+def _format_event_times(raw_start, raw_end, tz):
+    """
+    Formats one (start_time, end_time) pair in the zone 'tz'.
+    Results are memoized because recurring events share the same timestamps, and batch or archive
+    runs see the same events again for every bulletin date.
+    Returns a tuple (sort_timestamp, day_key, start_time_formatted, time_range_formatted).
+    """
+    start = _parse_event_timestamp(raw_start, tz)
+    if not start:
+        # Fallback to the raw string, as before, if it could not be parsed
+        return (float('inf'), None, raw_start or "Date/Time TBD", None)
+
+    start_text = start.strftime("%A, %B %d, %Y at %I:%M %p") # Readable format
+    day_key = start.date().isoformat()
+    range_text = None
+    end = _parse_event_timestamp(raw_end, tz)
+    if end and end > start:
+        if end.date() == start.date():
+            range_text = f"{start_text} - {end.strftime('%I:%M %p')}"
+        else:
+            range_text = f"{start_text} - {end.strftime('%A, %B %d, %Y at %I:%M %p')}"
+    return (start.timestamp(), day_key, start_text, range_text)
+
+@functools.lru_cache(maxsize=16384)
+def _strip_event_html(text):
+    """strip_html_tags, memoized because titles and descriptions of recurring events repeat."""
+    return strip_html_tags(text)
+
+def normalize_events(events, timezone_name=DEFAULT_TIMEZONE):
+    """
+    Normalizes a list of event records in bulk for display.
+    In one pass over the events it strips HTML from 'title' and 'description', converts 'start_time'
+    and 'end_time' to 'timezone_name', and sets:
+      - 'start_time_formatted': e.g. "Saturday, March 16, 2024 at 10:00 AM" ("Date/Time TBD" if missing)
+      - 'time_range_formatted': start and end, e.g. "... at 10:00 AM - 12:00 PM" (None without an end time)
+      - 'day_key': the local date as "YYYY-MM-DD" (None if the start time is missing or invalid)
+    The events are then sorted by local start time; events without a usable start time go last.
+    Only strings are added to the events, so the result stays JSON-serializable.
+    Returns the sorted list (the event dictionaries are updated in place).
+    """
+    tz = get_event_timezone(timezone_name)
+    keyed_events = []
+    for event in events:
+        if event.get('title'):
+            event['title'] = _strip_event_html(event['title'])
+        if event.get('description'):
+            event['description'] = _strip_event_html(event['description'])
+
+        sort_timestamp, day_key, start_text, range_text = _format_event_times(event.get('start_time'), event.get('end_time'), tz)
+        event['start_time_formatted'] = start_text
+        event['time_range_formatted'] = range_text
+        event['day_key'] = day_key
+        keyed_events.append((sort_timestamp, len(keyed_events), event))
+
+    keyed_events.sort(key=lambda keyed_event: keyed_event[:2])
+    return [keyed_event[2] for keyed_event in keyed_events]
+
+@functools.lru_cache(maxsize=1024)
+def _format_day_key(day_key):
+    """Formats a "YYYY-MM-DD" day key as e.g. "Saturday, March 16, 2024" ("Date TBD" for None)."""
+    if not day_key:
+        return "Date TBD"
+    return datetime.date.fromisoformat(day_key).strftime("%A, %B %d, %Y")
+
+def group_events_by_day(events):
+    """
+    Groups events already sorted by normalize_events into days.
+    Returns a list of {'day_key', 'day_formatted', 'events'} dictionaries in date order;
+    events without a usable start time are collected in a final group with 'day_key' None.
+    """
+    days = []
+    for day_key, day_events in itertools.groupby(events, key=lambda event: event.get('day_key')):
+        days.append({'day_key': day_key, 'day_formatted': _format_day_key(day_key), 'events': list(day_events)})
+    return days
+
+def fetch_events_data(pb_config, bulletin_date_obj, timezone_name=DEFAULT_TIMEZONE):
+    """
+    Fetches all events and filters them based on end_time >= the start of bulletin_date_obj
+    in the church's timezone ('timezone_name').
     Assumes public read access for the events collection.
     'bulletin_date_obj' is a datetime.date object.
-    Returns a list of event items, or an empty list on error/no events.
+    Returns a list of event items normalized by normalize_events (empty if there are no events),
+    or None on error, so callers can tell a failed fetch from an empty one.
     """
     if not pb_config:
         print("ERROR: PocketBase configuration is not available for fetching events.")
-        return []
+        return None
 
     base_url = pb_config['pocketbase_url']
     collection_name = pb_config.get('events_collection_name') # Get from config
 
     if not collection_name:
         print("ERROR: 'events_collection_name' not found in PocketBase configuration.")
-        return []
+        return None
 
     api_url = f"{base_url}/api/collections/{collection_name}/records"
 
-    # Format the bulletin_date_obj to "YYYY-MM-DD 00:00:00" for the filter
-    filter_start_date_str = bulletin_date_obj.strftime("%Y-%m-%d 00:00:00")
+    # Local midnight of the bulletin day, expressed in UTC as PocketBase stores datetimes
+    local_midnight = datetime.datetime.combine(bulletin_date_obj, datetime.time.min, tzinfo=get_event_timezone(timezone_name))
+    filter_start_date_str = local_midnight.astimezone(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
     params = {
         # Filter for events where end_time is greater than or equal to the start of the bulletin day.
@@ -223,38 +382,22 @@ def fetch_events_data(pb_config, bulletin_date_obj):
 
     try:
         print(f"Fetching events data from: {api_url} with params: {params}")
-        response = requests.get(api_url, params=params)
+        response = get_http_client(pb_config).get(api_url, params=params)
         response.raise_for_status()
         
         data = response.json()
         events = data.get('items', [])
         
         print(f"Successfully fetched {len(events)} events.")
-        # Format start_time and strip HTML from relevant fields
-        for event in events:
-            if 'title' in event and event['title']:
-                event['title'] = strip_html_tags(event['title'])
-            if 'description' in event and event['description']:
-                event['description'] = strip_html_tags(event['description'])
-            
-            if 'start_time' in event and event['start_time']:
-                try:
-                    # Assuming start_time is like "2024-03-15 10:00:00.000Z"
-                    dt_obj = datetime.datetime.fromisoformat(event['start_time'].replace('Z', '+00:00'))
-                    event['start_time_formatted'] = dt_obj.strftime("%A, %B %d, %Y at %I:%M %p") # Readable format
-                except ValueError:
-                    event['start_time_formatted'] = event['start_time'] # Fallback to raw string
-            else:
-                event['start_time_formatted'] = "Date/Time TBD"
-
-        return events
+        # Strip HTML, convert times to the church's timezone and sort, all in one pass
+        return normalize_events(events, timezone_name)
 
     except requests.exceptions.RequestException as e:
         print(f"ERROR: Request failed while fetching events data: {e}")
-        return []
+        return None
     except Exception as e:
         print(f"ERROR: An unexpected error occurred while fetching events data: {e}")
-        return []
+        return None
 
 def parse_sabbath_school(ss_text):
     """
@@ -423,10 +566,42 @@ def parse_divine_worship(dw_text):
 
     return items
 
-def render_html_template(template_file_name, context_data):
+def create_renderer():
+    """
+    Builds a reusable renderer: the Jinja2 environment, the parsed stylesheet and a lock.
+    Sharing one renderer avoids re-parsing templates and CSS for every bulletin when several
+    bulletins are produced in one process. PDF writes are serialized through the lock because
+    WeasyPrint is not guaranteed to be thread-safe.
+    Returns the renderer dictionary, or None on error.
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    templates_abs_path = os.path.join(script_dir, TEMPLATES_DIR)
+    css_file_path = os.path.join(templates_abs_path, "style.css")
+    if not os.path.exists(css_file_path):
+        print(f"ERROR: CSS file not found at {css_file_path}")
+        return None
+
+    try:
+        renderer = {
+            'env': jinja2.Environment(
+                loader=jinja2.FileSystemLoader(templates_abs_path),
+                autoescape=jinja2.select_autoescape(['html', 'xml'])
+            ),
+            'css': CSS(css_file_path),
+            'base_url': templates_abs_path,
+            'pdf_lock': threading.Lock()
+        }
+        print(f"Shared renderer initialized from templates in {templates_abs_path}")
+        return renderer
+    except Exception as e:
+        print(f"ERROR: An unexpected error occurred while initializing the renderer: {e}")
+        return None
+
+def render_html_template(template_file_name, context_data, renderer=None):
     """
     Renders the Jinja2 HTML template with the given context.
     'template_file_name' is the name of the template file in the TEMPLATES_DIR.
+    If a shared 'renderer' (see create_renderer) is given, its Jinja2 environment is reused.
     Returns the rendered HTML as a string, or None on error.
     """
     try:
@@ -435,10 +610,13 @@ def render_html_template(template_file_name, context_data):
         # Combine with the TEMPLATES_DIR to get the absolute path to the templates folder
         templates_abs_path = os.path.join(script_dir, TEMPLATES_DIR)
         
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(templates_abs_path),
-            autoescape=jinja2.select_autoescape(['html', 'xml'])
-        )
+        if renderer:
+            env = renderer['env']
+        else:
+            env = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(templates_abs_path),
+                autoescape=jinja2.select_autoescape(['html', 'xml'])
+            )
         template = env.get_template(template_file_name)
         rendered_html = template.render(context_data)
         print(f"Successfully rendered HTML template: {template_file_name}")
@@ -450,11 +628,12 @@ def render_html_template(template_file_name, context_data):
         print(f"ERROR: An unexpected error occurred during HTML template rendering: {e}")
         return None
 
-def generate_pdf_from_html(html_string, output_pdf_path):
+def generate_pdf_from_html(html_string, output_pdf_path, renderer=None):
     """
     Converts HTML content to PDF using WeasyPrint.
     html_string: The HTML content as a string.
     output_pdf_path: The full path where the PDF will be saved.
+    renderer: Optional shared renderer (see create_renderer) whose parsed stylesheet is reused.
     The CSS is expected to be linked correctly in the HTML and resolvable
     relative to the base_url (templates directory).
     Returns True on success, False on error.
@@ -463,6 +642,18 @@ def generate_pdf_from_html(html_string, output_pdf_path):
         print("ERROR: No HTML content provided for PDF generation.")
         return False
 
+    if renderer:
+        try:
+            os.makedirs(os.path.dirname(output_pdf_path), exist_ok=True)
+            html_doc = HTML(string=html_string, base_url=renderer['base_url'])
+            with renderer['pdf_lock']:
+                html_doc.write_pdf(output_pdf_path, stylesheets=[renderer['css']])
+            print(f"Successfully generated PDF: {output_pdf_path}")
+            return True
+        except Exception as e:
+            print(f"ERROR: An unexpected error occurred during PDF generation: {e}")
+            return False
+
     try:
         script_dir = os.path.dirname(os.path.abspath(__file__))
         # base_url for resolving relative paths in HTML (like style.css link, or images if they were relative)
@@ -492,15 +683,27 @@ def generate_pdf_from_html(html_string, output_pdf_path):
         print(f"ERROR: An unexpected error occurred during PDF generation: {e}")
         return False
 
+def is_transient_request_error(error):
+    """
+    Tells whether a failed PocketBase request is worth retrying: connection errors and timeouts
+    (no response at all), 429 Too Many Requests and 5xx server errors. Other 4xx responses,
+    such as a wrong admin password (401) or a deleted record (404), will fail the same way again.
+    """
+    response = getattr(error, 'response', None)
+    if response is None:
+        return True
+    return response.status_code == 429 or response.status_code >= 500
+
 def upload_pdf_to_pocketbase(pb_config, bulletin_collection_id, bulletin_record_id, pdf_path, bulletin_record_data):
     """
     Uploads the generated PDF to the 'pdf' field of the specified bulletin record.
     Requires admin authentication.
-    Returns True on success, False on error.
+    Returns a tuple (success, transient). 'transient' is True only if the upload failed in a way
+    that a retry may fix (see is_transient_request_error); it is False on success.
     """
     if not pb_config:
         print("ERROR: PocketBase configuration is not available for PDF upload.")
-        return False
+        return False, False
 
     base_url = pb_config['pocketbase_url']
     admin_email = pb_config['pocketbase_admin_email']
@@ -517,20 +720,20 @@ def upload_pdf_to_pocketbase(pb_config, bulletin_collection_id, bulletin_record_
     }
     try:
         print(f"Authenticating admin user: {admin_email}")
-        auth_response = requests.post(auth_url, json=auth_payload)
+        auth_response = get_http_client(pb_config).post(auth_url, json=auth_payload)
         auth_response.raise_for_status()
         auth_data = auth_response.json()
         auth_token = auth_data.get('token')
         if not auth_token:
             print("ERROR: Admin authentication successful but no token received.")
-            return False
+            return False, False
         print("Admin authentication successful.")
     except requests.exceptions.RequestException as e:
-        print(f"ERROR: Admin authentication failed: {e} - Response: {e.response.text if e.response else 'No response'}")
-        return False
+        print(f"ERROR: Admin authentication failed: {e} - Response: {e.response.text if e.response is not None else 'No response'}")
+        return False, is_transient_request_error(e)
     except Exception as e:
         print(f"ERROR: An unexpected error occurred during admin authentication: {e}")
-        return False
+        return False, False
 
     # Common URL for updates
     update_url = f"{base_url}/api/collections/{bulletin_collection_id}/records/{bulletin_record_id}"
@@ -547,21 +750,441 @@ def upload_pdf_to_pocketbase(pb_config, bulletin_collection_id, bulletin_record_
                 'pdf': (pdf_filename, f, 'application/pdf')
             }
             print(f"Uploading PDF '{pdf_filename}' to record '{bulletin_record_id}' at {update_url}")
-            upload_response = requests.patch(update_url, headers=headers, files=files)
+            upload_response = get_http_client(pb_config).patch(update_url, headers=headers, files=files)
             upload_response.raise_for_status()
             print(f"Successfully uploaded PDF to PocketBase record ID: {bulletin_record_id}")
-            return True
+            return True, False
             
     except FileNotFoundError:
         print(f"ERROR: PDF file not found at {pdf_path} for upload.")
-        return False
+        return False, False
     except requests.exceptions.RequestException as e:
-        print(f"ERROR: PDF upload failed: {e} - Response: {e.response.text if e.response else 'No response'}")
-        return False
+        print(f"ERROR: PDF upload failed: {e} - Response: {e.response.text if e.response is not None else 'No response'}")
+        return False, is_transient_request_error(e)
     except Exception as e:
         print(f"ERROR: An unexpected error occurred during PDF upload: {e}")
+        return False, False
+
+def get_upload_retry_settings(config):
+    """
+    Reads the upload retry settings from the configuration, falling back to the module defaults.
+    Returns a dictionary with 'max_attempts', 'base_delay' and 'max_delay'.
+    """
+    config = config or {}
+    try:
+        return {
+            'max_attempts': max(1, int(config.get('upload_max_attempts', UPLOAD_MAX_ATTEMPTS))),
+            'base_delay': max(0.0, float(config.get('upload_retry_base_delay', UPLOAD_RETRY_BASE_DELAY))),
+            'max_delay': max(0.0, float(config.get('upload_retry_max_delay', UPLOAD_RETRY_MAX_DELAY)))
+        }
+    except (TypeError, ValueError) as e:
+        print(f"WARNING: Invalid upload retry settings in configuration ({e}). Using defaults.")
+        return {
+            'max_attempts': UPLOAD_MAX_ATTEMPTS,
+            'base_delay': UPLOAD_RETRY_BASE_DELAY,
+            'max_delay': UPLOAD_RETRY_MAX_DELAY
+        }
+
+def upload_pdf_with_retry(pb_config, bulletin_collection_id, bulletin_record_id, pdf_path, bulletin_record_data, retry_settings):
+    """
+    Calls upload_pdf_to_pocketbase, retrying transient failures with exponential backoff and full jitter.
+    The delay before attempt n+1 is a random value between 0 and min(max_delay, base_delay * 2**(n-1)).
+    Permanent failures (e.g., a rejected password or a missing record) are not retried.
+    Returns a tuple (success, transient) like upload_pdf_to_pocketbase; after the last attempt
+    'transient' tells whether the upload is still worth queuing for a later run.
+    """
+    max_attempts = retry_settings['max_attempts']
+    for attempt in range(1, max_attempts + 1):
+        success, transient = upload_pdf_to_pocketbase(pb_config, bulletin_collection_id, bulletin_record_id, pdf_path, bulletin_record_data)
+        if success:
+            return True, False
+        if not transient:
+            print("ERROR: PDF upload failed with a permanent error. Not retrying upload.")
+            return False, False
+        if attempt < max_attempts:
+            backoff_cap = min(retry_settings['max_delay'], retry_settings['base_delay'] * (2 ** (attempt - 1)))
+            delay = random.uniform(0, backoff_cap)
+            print(f"Upload attempt {attempt}/{max_attempts} failed. Retrying in {delay:.1f} seconds...")
+            time.sleep(delay)
+
+    print(f"ERROR: PDF upload failed after {max_attempts} attempts.")
+    return False, True
+
+def load_upload_outbox(outbox_path):
+    """
+    Loads the list of pending uploads from the outbox file.
+    Returns an empty list if the file does not exist or cannot be read.
+    """
+    if not os.path.exists(outbox_path):
+        return []
+
+    try:
+        with open(outbox_path, 'r') as f:
+            entries = json.load(f)
+        if not isinstance(entries, list):
+            print(f"WARNING: Upload outbox at {outbox_path} is malformed. Ignoring it.")
+            return []
+        return entries
+    except (OSError, ValueError) as e:
+        print(f"ERROR: Could not read upload outbox at {outbox_path}: {e}")
+        return []
+
+def write_json_atomic(file_path, data):
+    """
+    Writes 'data' as JSON to 'file_path'.
+    The file is written to a temporary path first and then renamed, so a crash never leaves a truncated file.
+    Returns True on success, False on error.
+    """
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        print(f"ERROR: Could not write JSON file {file_path}: {e}")
+        return False
+
+def save_upload_outbox(outbox_path, entries):
+    """
+    Writes the list of pending uploads to the outbox file.
+    An empty list removes the outbox file.
+    Returns True on success, False on error.
+    """
+    if entries:
+        return write_json_atomic(outbox_path, entries)
+
+    try:
+        if os.path.exists(outbox_path):
+            os.remove(outbox_path)
+        return True
+    except OSError as e:
+        print(f"ERROR: Could not remove upload outbox at {outbox_path}: {e}")
+        return False
+
+def enqueue_pending_upload(outbox_path, pb_config, bulletin_collection_id, bulletin_record_id, pdf_path, bulletin_date_str, last_error=None):
+    """
+    Records a failed upload in the outbox so a later run can retry it.
+    An existing entry for the same record is replaced rather than duplicated.
+    Returns True on success, False on error.
+    """
+    entries = [
+        entry for entry in load_upload_outbox(outbox_path)
+        if entry.get('record_id') != bulletin_record_id
+    ]
+    entries.append({
+        'record_id': bulletin_record_id,
+        'collection_id': bulletin_collection_id,
+        'pdf_path': os.path.abspath(pdf_path),
+        'bulletin_date': bulletin_date_str,
+        'pocketbase_url': pb_config['pocketbase_url'],
+        'queued_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'last_error': last_error
+    })
+    if save_upload_outbox(outbox_path, entries):
+        print(f"Queued PDF upload for record '{bulletin_record_id}' in outbox: {outbox_path}")
+        return True
+    return False
+
+def remove_pending_upload(outbox_path, bulletin_record_id):
+    """Drops any outbox entry for the given record (e.g., after a successful upload)."""
+    entries = load_upload_outbox(outbox_path)
+    remaining = [entry for entry in entries if entry.get('record_id') != bulletin_record_id]
+    if len(remaining) != len(entries):
+        save_upload_outbox(outbox_path, remaining)
+
+def drain_upload_outbox(pb_config, outbox_path, retry_settings):
+    """
+    Retries every pending upload left in the outbox by a previous run.
+    Entries for a different PocketBase URL are kept untouched. Entries whose PDF no longer exists,
+    or whose upload fails with a permanent error, are dropped so they cannot block later runs.
+    Returns a tuple (uploaded_count, remaining_count).
+    """
+    entries = load_upload_outbox(outbox_path)
+    if not entries:
+        return 0, 0
+
+    print(f"Found {len(entries)} pending upload(s) in outbox: {outbox_path}")
+    remaining = []
+    uploaded_count = 0
+    for entry in entries:
+        record_id = entry.get('record_id')
+        collection_id = entry.get('collection_id')
+        pdf_path = entry.get('pdf_path')
+
+        if not record_id or not collection_id or not pdf_path:
+            print(f"WARNING: Dropping malformed outbox entry: {entry}")
+            continue
+        if entry.get('pocketbase_url') and entry['pocketbase_url'] != pb_config['pocketbase_url']:
+            remaining.append(entry)
+            continue
+        if not os.path.exists(pdf_path):
+            print(f"WARNING: Dropping outbox entry for record '{record_id}': PDF {pdf_path} no longer exists.")
+            continue
+
+        print(f"Retrying pending upload of {pdf_path} to record '{record_id}'...")
+        success, transient = upload_pdf_with_retry(pb_config, collection_id, record_id, pdf_path, None, retry_settings)
+        if success:
+            uploaded_count += 1
+        elif not transient:
+            print(f"WARNING: Dropping outbox entry for record '{record_id}': the upload failed with a permanent error. Upload {pdf_path} manually or rerun after fixing the cause.")
+        else:
+            entry['last_error'] = "Upload retry from outbox failed"
+            entry['attempted_at'] = datetime.datetime.now().isoformat(timespec='seconds')
+            remaining.append(entry)
+
+    save_upload_outbox(outbox_path, remaining)
+    print(f"Outbox drain finished: {uploaded_count} uploaded, {len(remaining)} still pending.")
+    return uploaded_count, len(remaining)
+
+def get_archive_db_path(config):
+    """Returns the absolute path of the archive index for a config (inside its output directory)."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(script_dir, (config or {}).get('output_dir', OUTPUT_DIR), ARCHIVE_DB_FILE)
+
+def open_archive_index(db_path):
+    """
+    Opens (and creates if needed) the SQLite archive index of parsed bulletin items.
+    'archive_bulletins' tracks which bulletin record version is indexed for each date, and the
+    FTS5 table 'archive_items' holds one row per Sabbath School / Divine Worship item.
+    Returns the connection, or None on error (e.g., SQLite built without FTS5).
+    """
+    connection = None
+    try:
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        connection = sqlite3.connect(db_path)
+        connection.executescript("""
+            CREATE TABLE IF NOT EXISTS archive_bulletins (
+                bulletin_date TEXT PRIMARY KEY,
+                record_id TEXT,
+                record_updated TEXT,
+                title TEXT,
+                indexed_at TEXT
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS archive_items USING fts5(
+                bulletin_date UNINDEXED,
+                section UNINDEXED,
+                item_type,
+                label,
+                title,
+                speaker,
+                details,
+                tokenize = 'unicode61 remove_diacritics 2'
+            );
+        """)
+        schema_version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if schema_version < ARCHIVE_SCHEMA_VERSION:
+            # Rows written by an older version are laid out differently (e.g., Sabbath School slot times
+            # were indexed), so they are cleared and re-indexed as bulletins are generated or backfilled
+            with connection:
+                had_rows = connection.execute("SELECT 1 FROM archive_bulletins LIMIT 1").fetchone()
+                connection.execute("DELETE FROM archive_items")
+                connection.execute("DELETE FROM archive_bulletins")
+                connection.execute(f"PRAGMA user_version = {ARCHIVE_SCHEMA_VERSION}")
+            if had_rows:
+                print(f"WARNING: Archive index at {db_path} was built by an older version and has been cleared. Run --backfill-archive to rebuild it.")
+        return connection
+    except (OSError, sqlite3.Error) as e:
+        print(f"ERROR: Could not open archive index at {db_path}: {e}")
+        if connection:
+            connection.close()
+        return None
+
+def index_bulletin_items(db_path, bulletin_date_str, bulletin_record, sabbath_school_items, divine_worship_items, connection=None):
+    """
+    Stores the parsed items of one bulletin in the archive index, replacing any earlier version.
+    Bulletins whose record 'updated' timestamp matches the indexed version are skipped,
+    so regenerating or backfilling the same bulletin does no extra work.
+    'connection' is an optional connection from open_archive_index to reuse (e.g., during a backfill);
+    it is left open. Without it, a connection to 'db_path' is opened and closed here.
+    Returns True if the bulletin was (re)indexed, False if it was unchanged or on error.
+    """
+    owns_connection = connection is None
+    if owns_connection:
+        connection = open_archive_index(db_path)
+        if not connection:
+            return False
+
+    record_updated = bulletin_record.get('updated')
+    try:
+        with connection:
+            row = connection.execute(
+                "SELECT record_updated FROM archive_bulletins WHERE bulletin_date = ?",
+                (bulletin_date_str,)
+            ).fetchone()
+            if row and record_updated and row[0] == record_updated:
+                return False
+
+            connection.execute("DELETE FROM archive_items WHERE bulletin_date = ?", (bulletin_date_str,))
+            # Sabbath School details are usually the person leading the item, so they are stored as the speaker.
+            # The fixed slot time is not stored: it is the same every week and would match searches like "AM".
+            rows = [
+                (bulletin_date_str, 'sabbath_school', 'Sabbath School', item.get('label'), None, item.get('details'), None)
+                for item in sabbath_school_items
+            ] + [
+                (bulletin_date_str, 'divine_worship', item.get('type'), item.get('label'), item.get('title'), item.get('speaker'), item.get('details'))
+                for item in divine_worship_items
+            ]
+            connection.executemany(
+                "INSERT INTO archive_items (bulletin_date, section, item_type, label, title, speaker, details) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO archive_bulletins (bulletin_date, record_id, record_updated, title, indexed_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    bulletin_date_str,
+                    bulletin_record.get('id'),
+                    record_updated,
+                    strip_html_tags(bulletin_record.get('title', '')),
+                    datetime.datetime.now().isoformat(timespec='seconds')
+                )
+            )
+        print(f"Indexed {len(rows)} bulletin items for {bulletin_date_str} in archive: {db_path}")
+        return True
+    except sqlite3.Error as e:
+        print(f"ERROR: Could not index bulletin {bulletin_date_str} in archive: {e}")
+        return False
+    finally:
+        if owns_connection:
+            connection.close()
+
+def _build_fts_query(query_text):
+    """
+    Turns free text into an FTS5 query: every word must match, the last one as a prefix.
+    Words are quoted so punctuation in hymn titles or names cannot break the query syntax.
+    Returns None if the text contains no searchable words.
+    """
+    words = re.findall(r'\w+', query_text)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return " ".join(terms)
+
+def search_archive(db_path, query_text, item_type=None, limit=20):
+    """
+    Searches the archive index for items matching 'query_text' (in type, label, title, speaker or details).
+    'item_type' optionally restricts results to one item type (e.g., 'Sermon', 'Hymn'), case-insensitively.
+    Returns a list of result dictionaries, newest bulletin first (empty if nothing matches),
+    or None if the search could not run (no index yet, an unusable query or a database error).
+    """
+    if not os.path.exists(db_path):
+        print(f"ERROR: No archive index found at {db_path}. Generate a bulletin or run --backfill-archive first.")
+        return None
+
+    fts_query = _build_fts_query(query_text)
+    if not fts_query:
+        print(f"ERROR: Search query '{query_text}' contains no searchable words.")
+        return None
+
+    connection = open_archive_index(db_path)
+    if not connection:
+        return None
+
+    sql = ("SELECT bulletin_date, section, item_type, label, title, speaker, details "
+           "FROM archive_items WHERE archive_items MATCH ?")
+    params = [fts_query]
+    if item_type:
+        sql += " AND lower(item_type) = lower(?)"
+        params.append(item_type)
+    sql += " ORDER BY bulletin_date DESC, rank LIMIT ?"
+    params.append(limit)
+
+    try:
+        columns = ['bulletin_date', 'section', 'type', 'label', 'title', 'speaker', 'details']
+        return [dict(zip(columns, row)) for row in connection.execute(sql, params)]
+    except sqlite3.Error as e:
+        print(f"ERROR: Archive search failed: {e}")
+        return None
+    finally:
+        connection.close()
+
+def print_archive_results(results):
+    """Prints archive search results, one item per line."""
+    if not results:
+        print("No matching bulletin items found.")
+        return
+    for result in results:
+        parts = [part for part in (result['title'], result['speaker'], result['details']) if part]
+        if result['section'] == 'sabbath_school':
+            # The label (e.g., "Lesson Study") is what tells Sabbath School items apart
+            heading = f"Sabbath School - {result['label']}"
+        else:
+            heading = result['type'] or result['label']
+        print(f"{result['bulletin_date']}  {heading}: {' - '.join(parts) or result['label']}")
+
+def fetch_all_bulletin_records(pb_config, per_page=200):
+    """
+    Fetches every bulletin record from PocketBase, page by page, oldest first.
+    Returns a list of records, or None on error.
+    """
+    base_url = pb_config['pocketbase_url']
+    collection_name = pb_config['bulletin_collection_name']
+    api_url = f"{base_url}/api/collections/{collection_name}/records"
+
+    records = []
+    page = 1
+    try:
+        while True:
+            params = {'page': page, 'perPage': per_page, 'sort': '+date'}
+            print(f"Fetching bulletin archive page {page} from: {api_url}")
+            response = get_http_client(pb_config).get(api_url, params=params)
+            response.raise_for_status()
+            data = response.json()
+            records.extend(data.get('items', []))
+            if page >= data.get('totalPages', 1):
+                break
+            page += 1
+        print(f"Successfully fetched {len(records)} bulletin records for the archive.")
+        return records
+    except requests.exceptions.RequestException as e:
+        print(f"ERROR: Request failed while fetching bulletin archive: {e}")
+        return None
+    except Exception as e:
+        print(f"ERROR: An unexpected error occurred while fetching bulletin archive: {e}")
+        return None
+
+def backfill_archive(config):
+    """
+    Indexes every bulletin in PocketBase into the archive index of the given config.
+    Unchanged bulletins (same record 'updated' timestamp) are skipped, so repeated backfills are cheap.
+    Returns True on success, False on error.
+    """
+    pb_config = get_pocketbase_client(config)
+    if not pb_config:
         return False
 
+    records = fetch_all_bulletin_records(pb_config)
+    if records is None:
+        return False
+
+    db_path = get_archive_db_path(config)
+    connection = open_archive_index(db_path)
+    if not connection:
+        return False
+
+    indexed_count = 0
+    try:
+        for record in records:
+            bulletin_date_str = str(record.get('date', ''))[:10]
+            try:
+                datetime.datetime.strptime(bulletin_date_str, "%Y-%m-%d")
+            except ValueError:
+                print(f"WARNING: Skipping bulletin record '{record.get('id')}' with invalid date '{record.get('date')}'.")
+                continue
+            sabbath_school_items = parse_sabbath_school(record.get('sabbath_school', ''))
+            divine_worship_items = parse_divine_worship(record.get('divine_worship', ''))
+            if index_bulletin_items(db_path, bulletin_date_str, record, sabbath_school_items, divine_worship_items, connection):
+                indexed_count += 1
+    finally:
+        connection.close()
+
+    print(f"Archive backfill finished: {indexed_count} bulletin(s) indexed, {len(records) - indexed_count} unchanged or skipped.")
+    return True
+
 def cleanup_temp_files(image_path):
     """Removes temporary downloaded files (e.g., cover image)."""
     if not image_path or not os.path.exists(image_path):
@@ -576,142 +1199,651 @@ def cleanup_temp_files(image_path):
     except Exception as e:
         print(f"ERROR: An unexpected error occurred during file cleanup for {image_path}: {e}")
 
-def main_process(bulletin_date_str):
+def acquire_run_lock(lock_path):
+    """
+    Takes an exclusive, non-blocking lock on 'lock_path' so overlapping runs (e.g., cron and a
+    manual run) for the same output directory never work on the same files at the same time.
+    The lock is released automatically if the process dies.
+    Returns the open lock file on success, or None if another run holds the lock.
+    """
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    lock_file = open(lock_path, 'a+')
+    if fcntl is None:
+        print("WARNING: File locking is not available on this platform. Overlapping runs are not prevented.")
+        return lock_file
+
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+
+    lock_file.seek(0)
+    lock_file.truncate()
+    lock_file.write(f"{os.getpid()}\n")
+    lock_file.flush()
+    return lock_file
+
+def release_run_lock(lock_file):
+    """Releases a lock taken with acquire_run_lock."""
+    if not lock_file:
+        return
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    finally:
+        lock_file.close()
+
+def load_run_journal(journal_path):
+    """
+    Loads the run journal for one bulletin date.
+    Returns the journal dictionary, or None if it does not exist or cannot be read.
+    """
+    if not os.path.exists(journal_path):
+        return None
+
+    try:
+        with open(journal_path, 'r') as f:
+            journal = json.load(f)
+        if not isinstance(journal, dict) or not isinstance(journal.get('stages'), dict):
+            print(f"WARNING: Run journal at {journal_path} is malformed. Ignoring it.")
+            return None
+        return journal
+    except (OSError, ValueError) as e:
+        print(f"ERROR: Could not read run journal at {journal_path}: {e}")
+        return None
+
+def new_run_journal(bulletin_date_str):
+    """Returns an empty run journal for the given bulletin date."""
+    return {
+        'bulletin_date': bulletin_date_str,
+        'status': 'running',
+        'failed_stage': None,
+        'started_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'updated_at': None,
+        'stages': {}
+    }
+
+def save_run_journal(journal_path, journal):
+    """Writes the run journal atomically. Returns True on success, False on error."""
+    journal['updated_at'] = datetime.datetime.now().isoformat(timespec='seconds')
+    if write_json_atomic(journal_path, journal):
+        return True
+    print(f"ERROR: Could not write run journal at {journal_path}")
+    return False
+
+def checkpoint_stage(journal_path, journal, stage_name, stage_output):
+    """
+    Records a completed stage and its output in the run journal and saves it.
+    Returns True if the journal was saved, False on error.
+    """
+    journal['stages'][stage_name] = stage_output
+    return save_run_journal(journal_path, journal)
+
+def get_checkpointed_cover_image(journal_path):
+    """
+    Returns the cover image path recorded in the saved run journal at 'journal_path',
+    or None if no saved checkpoint refers to a downloaded image.
+    """
+    journal = load_run_journal(journal_path)
+    if not journal:
+        return None
+    return (journal['stages'].get('download_cover_image') or {}).get('path')
+
+def cleanup_unless_checkpointed(journal_path, image_path):
+    """
+    Removes a downloaded cover image after a halted run, unless the saved run journal refers to it,
+    in which case it is kept for --resume (a later fresh run or completed run removes it).
+    """
+    if image_path and get_checkpointed_cover_image(journal_path) == image_path:
+        print(f"INFO: Keeping cover image {image_path} for a resumed run.")
+        return
+    cleanup_temp_files(image_path)
+
+def get_resumable_stages(journal):
+    """
+    Returns the stage outputs from 'journal' that can be reused by a resumed run.
+    Stages are checked in RUN_STAGES order; the first stage that is missing, or whose
+    files no longer exist, ends the list, so it and every later stage run again.
+    The downloaded cover image is only needed while the PDF still has to be generated;
+    if it is gone by then, the download and the HTML that refers to it are redone.
+    """
+    if not journal:
+        return {}
+
+    file_fields = {
+        'render_html': 'html_path',
+        'generate_pdf': 'pdf_path'
+    }
+    resumable = {}
+    for stage_name in RUN_STAGES:
+        stage_output = journal['stages'].get(stage_name)
+        if stage_output is None:
+            break
+        file_field = file_fields.get(stage_name)
+        if file_field and not os.path.exists(stage_output.get(file_field) or ''):
+            print(f"INFO: Checkpoint for stage '{stage_name}' refers to a missing file. Re-running from this stage.")
+            break
+        resumable[stage_name] = stage_output
+
+    # A bulletin without a cover image is checkpointed with a None path and needs no file
+    cover_image_path = (resumable.get('download_cover_image') or {}).get('path')
+    if cover_image_path and 'generate_pdf' not in resumable and not os.path.exists(cover_image_path):
+        print("INFO: Checkpointed cover image is missing. Downloading it and rendering the HTML again.")
+        for stage_name in ('download_cover_image', 'render_html', 'generate_pdf', 'upload'):
+            resumable.pop(stage_name, None)
+    return resumable
+
+def _record_stage_timing(report, stage_name, stage_started):
+    """Adds the elapsed time (in seconds) since 'stage_started' to the run report under 'stage_name'."""
+    if report is not None:
+        report.setdefault('timings', {})[stage_name] = round(time.perf_counter() - stage_started, 3)
+
+def _halt_process(report, stage_name, message, journal_path=None, journal=None):
+    """
+    Prints the halt message, records the failed stage in the run report (and run journal,
+    if given) and returns False.
+    """
+    print(f"PROCESS HALTED: {message}")
+    if report is not None:
+        report['status'] = 'failed'
+        report['failed_stage'] = stage_name
+        report['error'] = message
+    if journal is not None:
+        journal['status'] = 'failed'
+        journal['failed_stage'] = stage_name
+        save_run_journal(journal_path, journal)
+    return False
+
+def main_process(bulletin_date_str, config=None, renderer=None, http_sessions=None, report=None, resume=False):
     """
     Main orchestration function.
     Takes a date string (e.g., "2024-03-15") to identify the bulletin.
+    config: Optional, already loaded configuration. Loaded from config.toml when not given.
+    renderer: Optional shared renderer (see create_renderer).
+    http_sessions: Optional dictionary mapping PocketBase URLs to shared requests sessions.
+    report: Optional dictionary that receives the status, failed stage and per-stage timings.
+    resume: If True, stages already checkpointed in the run journal for this date are skipped.
+    Returns True if the PDF was generated, False if the process halted.
     """
     print(f"--- Starting bulletin generation process for date: {bulletin_date_str} ---")
+    if report is not None:
+        report.update({'status': 'running', 'failed_stage': None, 'error': None, 'timings': {}, 'resumed_stages': []})
 
     # 1. Load config
-    config = load_config()
+    stage_started = time.perf_counter()
+    if config is None:
+        config = load_config()
     if not config:
-        print("PROCESS HALTED: Configuration loading failed.")
-        return
+        return _halt_process(report, 'load_config', "Configuration loading failed.")
 
     # 2. Get PocketBase client details (not a client object, just config dict)
     pb_config = get_pocketbase_client(config)
     if not pb_config:
-        print("PROCESS HALTED: PocketBase client configuration failed.")
-        return
+        return _halt_process(report, 'load_config', "PocketBase client configuration failed.")
+    if http_sessions:
+        pb_config['http_session'] = http_sessions.get(pb_config['pocketbase_url'])
 
     # Create a datetime.date object from bulletin_date_str for functions that need it
     try:
         bulletin_date_obj = datetime.datetime.strptime(bulletin_date_str, "%Y-%m-%d").date()
     except ValueError:
-        print(f"PROCESS HALTED: Invalid bulletin_date_str format: '{bulletin_date_str}'. Please use YYYY-MM-DD.")
-        return
+        return _halt_process(report, 'load_config', f"Invalid bulletin_date_str format: '{bulletin_date_str}'. Please use YYYY-MM-DD.")
+
+    # Output and temp directories may be overridden per config (used to isolate tenants)
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    output_dir_abs = os.path.join(script_dir, config.get('output_dir', OUTPUT_DIR))
+    run_paths = {
+        'output_dir': output_dir_abs,
+        'temp_image_dir': os.path.join(script_dir, config.get('temp_image_dir', TEMP_IMAGE_DIR)),
+        'upload_outbox': os.path.join(output_dir_abs, UPLOAD_OUTBOX_FILE),
+        'journal': os.path.join(output_dir_abs, JOURNAL_DIR, f"run_{bulletin_date_str}.json"),
+        'html': os.path.join(output_dir_abs, JOURNAL_DIR, f"bulletin_{bulletin_date_str}.html"),
+        'pdf': os.path.join(output_dir_abs, f"bulletin_{bulletin_date_str}.pdf")
+    }
+    _record_stage_timing(report, 'load_config', stage_started)
+
+    # Only one run at a time may touch this output directory, its temp images and its outbox
+    lock_file = acquire_run_lock(os.path.join(output_dir_abs, RUN_LOCK_FILE))
+    if not lock_file:
+        return _halt_process(report, 'lock', f"Another bulletin run is already in progress for {output_dir_abs}.")
+
+    try:
+        return _run_bulletin_stages(bulletin_date_str, bulletin_date_obj, config, pb_config, run_paths, renderer, report, resume)
+    finally:
+        release_run_lock(lock_file)
+
+def _run_bulletin_stages(bulletin_date_str, bulletin_date_obj, config, pb_config, run_paths, renderer, report, resume):
+    """
+    Runs the checkpointed stages of main_process while the run lock is held.
+    Each completed stage is saved to the per-date run journal; with 'resume', stages found
+    in the journal (see get_resumable_stages) are reused instead of being run again.
+    """
+    process_started = time.perf_counter()
+    upload_retry_settings = get_upload_retry_settings(config)
+    journal_path = run_paths['journal']
+
+    if not resume:
+        # A fresh run discards the old journal, so an image kept for resuming it is no longer needed
+        old_cover_image_path = get_checkpointed_cover_image(journal_path)
+        if old_cover_image_path and os.path.exists(old_cover_image_path):
+            cleanup_temp_files(old_cover_image_path)
+
+    journal = load_run_journal(journal_path) if resume else None
+    if journal and journal.get('status') == 'completed':
+        print(f"Run journal shows the bulletin for {bulletin_date_str} was already completed. Nothing to resume.")
+        if report is not None:
+            report['status'] = 'completed'
+            report['resumed_stages'] = list(journal['stages'])
+            report['pdf_path'] = journal['stages'].get('generate_pdf', {}).get('pdf_path')
+        return True
+
+    completed = get_resumable_stages(journal)
+    if resume and not journal:
+        print(f"No run journal found for {bulletin_date_str}. Starting a fresh run.")
+    journal = new_run_journal(bulletin_date_str)
+    journal['stages'] = dict(completed)
+    save_run_journal(journal_path, journal)
+    if completed:
+        print(f"Resuming run for {bulletin_date_str}. Skipping completed stages: {', '.join(completed)}")
+        if report is not None:
+            report['resumed_stages'] = list(completed)
+
+    # Retry any uploads left pending by a previous run before doing new work
+    stage_started = time.perf_counter()
+    drain_upload_outbox(pb_config, run_paths['upload_outbox'], upload_retry_settings)
+    _record_stage_timing(report, 'drain_outbox', stage_started)
 
     # 3. Fetch bulletin data
-    print("Fetching bulletin main data...")
-    bulletin_record = fetch_bulletin_data(pb_config, bulletin_date_str)
-    if not bulletin_record:
-        print(f"PROCESS HALTED: Could not fetch bulletin data for {bulletin_date_str}.")
-        return
-    
-    print(f"DEBUG: Full bulletin record details: {bulletin_record}") # DEBUG PRINT
+    if 'fetch_bulletin' in completed:
+        bulletin_record = completed['fetch_bulletin']['record']
+    else:
+        print("Fetching bulletin main data...")
+        stage_started = time.perf_counter()
+        bulletin_record = fetch_bulletin_data(pb_config, bulletin_date_str)
+        _record_stage_timing(report, 'fetch_bulletin', stage_started)
+        if not bulletin_record:
+            return _halt_process(report, 'fetch_bulletin', f"Could not fetch bulletin data for {bulletin_date_str}.", journal_path, journal)
+
+        print(f"DEBUG: Full bulletin record details: {bulletin_record}") # DEBUG PRINT
     
     bulletin_record_id = bulletin_record.get('id')
     bulletin_collection_id = bulletin_record.get('collectionId') # PB provides this
     if not bulletin_record_id or not bulletin_collection_id:
-        print("PROCESS HALTED: Bulletin record ID or Collection ID missing from fetched data.")
-        return
+        return _halt_process(report, 'fetch_bulletin', "Bulletin record ID or Collection ID missing from fetched data.", journal_path, journal)
+    if 'fetch_bulletin' not in completed:
+        checkpoint_stage(journal_path, journal, 'fetch_bulletin', {'record': bulletin_record})
 
     # 4. Download cover image
-    print("Downloading cover image...")
-    # Assuming 'cover_image' is the field name in PB for the image filename
-    # Ensure TEMP_IMAGE_DIR is an absolute path or resolvable from script location
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    temp_image_save_dir = os.path.join(script_dir, TEMP_IMAGE_DIR)
-    
-    downloaded_cover_image_path = download_cover_image(
-        pb_config, 
-        bulletin_collection_id, 
-        bulletin_record_id, 
-        'cover_image', # Field name for the image in the bulletin record
-        bulletin_record, 
-        temp_image_save_dir
-    )
-    if not downloaded_cover_image_path:
-        print("PROCESS CONTINUING WITHOUT COVER IMAGE: Cover image download failed.")
-        # Allow process to continue, template can handle missing image
+    if 'download_cover_image' in completed:
+        downloaded_cover_image_path = completed['download_cover_image']['path']
+    elif not bulletin_record.get('cover_image'):
+        # No cover image is a normal case the template handles, so the stage is complete
+        print("No cover image set for this bulletin. Continuing without one.")
+        downloaded_cover_image_path = None
+        checkpoint_stage(journal_path, journal, 'download_cover_image', {'path': None, 'status': 'missing'})
+    else:
+        print("Downloading cover image...")
+        # Assuming 'cover_image' is the field name in PB for the image filename
+        stage_started = time.perf_counter()
+        downloaded_cover_image_path = download_cover_image(
+            pb_config, 
+            bulletin_collection_id, 
+            bulletin_record_id, 
+            'cover_image', # Field name for the image in the bulletin record
+            bulletin_record, 
+            run_paths['temp_image_dir']
+        )
+        _record_stage_timing(report, 'download_cover_image', stage_started)
+        if downloaded_cover_image_path:
+            checkpoint_stage(journal_path, journal, 'download_cover_image', {'path': downloaded_cover_image_path, 'status': 'downloaded'})
+        else:
+            # A failed download is not checkpointed, so a resumed run tries it again
+            print("PROCESS CONTINUING WITHOUT COVER IMAGE: Cover image download failed.")
+            # Allow process to continue, template can handle missing image
 
     # 5. Fetch and filter events (announcements)
-    print("Fetching announcements (events data)...")
-    announcements = fetch_events_data(pb_config, bulletin_date_obj)
-    # fetch_events_data returns [] on error, so we can proceed
-
-    # 6. Parse Sabbath School text
-    print("Parsing Sabbath School text...")
-    ss_text = bulletin_record.get('sabbath_school', '')
-    sabbath_school_items = parse_sabbath_school(ss_text)
-
-    # 7. Parse Divine Worship text
-    print("Parsing Divine Worship text...")
-    dw_text = bulletin_record.get('divine_worship', '')
-    divine_worship_items = parse_divine_worship(dw_text)
-
-    # 8. Prepare context for Jinja2 template
-    print("Preparing template context...")
-    bulletin_theme_title = strip_html_tags(bulletin_record.get('title', 'Welcome'))
-    sunset_times = strip_html_tags(bulletin_record.get('sunset', 'Not available'))
-    context_data = {
-        'bulletin_date': bulletin_date_obj.strftime("%B %d, %Y"), # Formatted date
-        'bulletin_theme_title': bulletin_theme_title,
-        'church_name': config.get('church_name', 'Rockville Tolland SDA Church'), # Get from config or default
-        'cover_image_path': downloaded_cover_image_path, # Will be None if download failed
-        'sabbath_school_items': sabbath_school_items,
-        'divine_worship_items': divine_worship_items,
-        'announcements': announcements,
-        'sunset_times': sunset_times,
-        'contact_info': { # Could also be loaded from config if it varies
-            'phone': config.get('contact_phone', '860-875-0450'),
-            'website': config.get('contact_website', 'rockvilletollandsda.church'),
-            'youtube': config.get('contact_youtube', 'YouTube.com/@RockvilleTollandSDAChurch'),
-            'address': config.get('contact_address', '9 Hartford Tpke Tolland CT 06084')
+    if 'fetch_events' in completed:
+        announcements = completed['fetch_events']['announcements']
+    else:
+        print("Fetching announcements (events data)...")
+        stage_started = time.perf_counter()
+        announcements = fetch_events_data(pb_config, bulletin_date_obj, config.get('timezone', DEFAULT_TIMEZONE))
+        _record_stage_timing(report, 'fetch_events', stage_started)
+        if announcements is None:
+            # A failed fetch is not checkpointed, so a resumed run fetches the events again
+            print("PROCESS CONTINUING WITHOUT ANNOUNCEMENTS: Events fetch failed.")
+            announcements = []
+        else:
+            checkpoint_stage(journal_path, journal, 'fetch_events', {'announcements': announcements})
+
+    if 'parse' in completed:
+        sabbath_school_items = completed['parse']['sabbath_school_items']
+        divine_worship_items = completed['parse']['divine_worship_items']
+    else:
+        stage_started = time.perf_counter()
+        # 6. Parse Sabbath School text
+        print("Parsing Sabbath School text...")
+        ss_text = bulletin_record.get('sabbath_school', '')
+        sabbath_school_items = parse_sabbath_school(ss_text)
+
+        # 7. Parse Divine Worship text
+        print("Parsing Divine Worship text...")
+        dw_text = bulletin_record.get('divine_worship', '')
+        divine_worship_items = parse_divine_worship(dw_text)
+        _record_stage_timing(report, 'parse', stage_started)
+        checkpoint_stage(journal_path, journal, 'parse', {
+            'sabbath_school_items': sabbath_school_items,
+            'divine_worship_items': divine_worship_items
+        })
+
+    # Keep the searchable archive in step with every generated bulletin (not fatal on error)
+    index_bulletin_items(
+        get_archive_db_path(config),
+        bulletin_date_str,
+        bulletin_record,
+        sabbath_school_items,
+        divine_worship_items
+    )
+
+    if 'render_html' in completed:
+        with open(completed['render_html']['html_path'], 'r') as f:
+            html_output = f.read()
+    else:
+        # 8. Prepare context for Jinja2 template
+        print("Preparing template context...")
+        bulletin_theme_title = strip_html_tags(bulletin_record.get('title', 'Welcome'))
+        sunset_times = strip_html_tags(bulletin_record.get('sunset', 'Not available'))
+        context_data = {
+            'bulletin_date': bulletin_date_obj.strftime("%B %d, %Y"), # Formatted date
+            'bulletin_theme_title': bulletin_theme_title,
+            'church_name': config.get('church_name', 'Rockville Tolland SDA Church'), # Get from config or default
+            'cover_image_path': downloaded_cover_image_path, # Will be None if download failed
+            'sabbath_school_items': sabbath_school_items,
+            'divine_worship_items': divine_worship_items,
+            'announcements': announcements,
+            'announcement_days': group_events_by_day(announcements), # Same events grouped by local day
+            'sunset_times': sunset_times,
+            'contact_info': { # Could also be loaded from config if it varies
+                'phone': config.get('contact_phone', '860-875-0450'),
+                'website': config.get('contact_website', 'rockvilletollandsda.church'),
+                'youtube': config.get('contact_youtube', 'YouTube.com/@RockvilleTollandSDAChurch'),
+                'address': config.get('contact_address', '9 Hartford Tpke Tolland CT 06084')
+            }
         }
-    }
 
-    # 9. Render HTML
-    print("Rendering HTML template...")
-    html_output = render_html_template('bulletin_template.html', context_data)
-    if not html_output:
-        print("PROCESS HALTED: HTML rendering failed.")
-        cleanup_temp_files(downloaded_cover_image_path)
-        return
+        # 9. Render HTML
+        print("Rendering HTML template...")
+        stage_started = time.perf_counter()
+        html_output = render_html_template('bulletin_template.html', context_data, renderer)
+        _record_stage_timing(report, 'render_html', stage_started)
+        if not html_output:
+            cleanup_unless_checkpointed(journal_path, downloaded_cover_image_path)
+            return _halt_process(report, 'render_html', "HTML rendering failed.", journal_path, journal)
+
+        try:
+            os.makedirs(os.path.dirname(run_paths['html']), exist_ok=True)
+            with open(run_paths['html'], 'w') as f:
+                f.write(html_output)
+            checkpoint_stage(journal_path, journal, 'render_html', {'html_path': run_paths['html']})
+        except OSError as e:
+            print(f"WARNING: Could not save rendered HTML checkpoint: {e}")
 
     # 10. Generate PDF
-    print("Generating PDF...")
-    # Ensure OUTPUT_DIR is an absolute path or resolvable
-    output_dir_abs = os.path.join(script_dir, OUTPUT_DIR)
-    os.makedirs(output_dir_abs, exist_ok=True)
-    pdf_filename = f"bulletin_{bulletin_date_str}.pdf"
-    output_pdf_path = os.path.join(output_dir_abs, pdf_filename)
-    
-    pdf_generation_success = generate_pdf_from_html(html_output, output_pdf_path)
-    if not pdf_generation_success:
-        print("PROCESS HALTED: PDF generation failed.")
-        cleanup_temp_files(downloaded_cover_image_path)
-        return
+    output_pdf_path = run_paths['pdf']
+    if 'generate_pdf' not in completed:
+        print("Generating PDF...")
+        os.makedirs(run_paths['output_dir'], exist_ok=True)
+        stage_started = time.perf_counter()
+        pdf_generation_success = generate_pdf_from_html(html_output, output_pdf_path, renderer)
+        _record_stage_timing(report, 'generate_pdf', stage_started)
+        if not pdf_generation_success:
+            cleanup_unless_checkpointed(journal_path, downloaded_cover_image_path)
+            return _halt_process(report, 'generate_pdf', "PDF generation failed.", journal_path, journal)
+        checkpoint_stage(journal_path, journal, 'generate_pdf', {'pdf_path': output_pdf_path})
 
     # 11. Upload PDF to PocketBase
-    print("Uploading PDF to PocketBase...")
-    upload_success = upload_pdf_to_pocketbase(
-        pb_config, 
-        bulletin_collection_id, 
-        bulletin_record_id, 
-        output_pdf_path,
-        bulletin_record # Pass the fetched bulletin_record here
-    )
-    if not upload_success:
-        print("PROCESS WARNING: PDF upload to PocketBase failed. PDF is available locally.")
-        # Don't halt, PDF is still generated locally.
+    upload_success = True
+    upload_queued = False
+    if 'upload' in completed:
+        upload_success = completed['upload']['uploaded']
+        upload_queued = completed['upload'].get('queued', not upload_success)
+    else:
+        print("Uploading PDF to PocketBase...")
+        stage_started = time.perf_counter()
+        upload_success, upload_transient = upload_pdf_with_retry(
+            pb_config, 
+            bulletin_collection_id, 
+            bulletin_record_id, 
+            output_pdf_path,
+            bulletin_record, # Pass the fetched bulletin_record here
+            upload_retry_settings
+        )
+        _record_stage_timing(report, 'upload', stage_started)
+        if upload_success:
+            # A fresh upload supersedes any older pending entry for this record
+            remove_pending_upload(run_paths['upload_outbox'], bulletin_record_id)
+        elif not upload_transient:
+            # Retrying later cannot help until the cause (e.g., credentials) is fixed, so nothing is queued
+            print("PROCESS WARNING: PDF upload to PocketBase failed permanently. PDF is available locally.")
+            remove_pending_upload(run_paths['upload_outbox'], bulletin_record_id)
+        else:
+            print("PROCESS WARNING: PDF upload to PocketBase failed. PDF is available locally.")
+            # Don't halt, PDF is still generated locally. Queue it so the next run retries the upload.
+            upload_queued = True
+            enqueue_pending_upload(
+                run_paths['upload_outbox'],
+                pb_config,
+                bulletin_collection_id,
+                bulletin_record_id,
+                output_pdf_path,
+                bulletin_date_str,
+                last_error=f"Upload failed after {upload_retry_settings['max_attempts']} attempts"
+            )
+        # A queued upload is owned by the outbox from here on, so the stage counts as done.
+        # A permanent failure is not checkpointed, so --resume retries just the upload once it is fixed.
+        if upload_success or upload_queued:
+            checkpoint_stage(journal_path, journal, 'upload', {'uploaded': upload_success, 'queued': upload_queued})
     
     # 12. Cleanup temp image
     print("Cleaning up temporary files...")
     cleanup_temp_files(downloaded_cover_image_path)
 
+    if upload_success or upload_queued:
+        journal['status'] = 'completed'
+    else:
+        journal['status'] = 'failed'
+        journal['failed_stage'] = 'upload'
+    save_run_journal(journal_path, journal)
+
+    if report is not None:
+        if upload_success:
+            report['status'] = 'completed'
+        elif upload_queued:
+            report['status'] = 'completed_upload_pending'
+        else:
+            report['status'] = 'completed_upload_failed'
+            report['failed_stage'] = 'upload'
+        report['pdf_path'] = output_pdf_path
+        _record_stage_timing(report, 'total', process_started)
+
     print(f"--- Bulletin generation process for date: {bulletin_date_str} COMPLETED ---")
+    return True
+
+def get_tenant_id(config, config_path):
+    """
+    Returns a filesystem-safe identifier for a tenant (one church config).
+    Uses the 'tenant_id' config key if present, otherwise the config file name,
+    or its directory name when the file is simply called config.toml.
+    """
+    tenant_id = config.get('tenant_id')
+    if not tenant_id:
+        config_abs_path = os.path.abspath(config_path)
+        tenant_id = os.path.splitext(os.path.basename(config_abs_path))[0]
+        if tenant_id == os.path.splitext(CONFIG_PATH)[0]:
+            tenant_id = os.path.basename(os.path.dirname(config_abs_path))
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', str(tenant_id)).strip('_') or "tenant"
+
+def apply_tenant_dirs(config, tenant_id):
+    """Defaults the config's output and temp image directories to per-tenant subdirectories."""
+    config.setdefault('output_dir', os.path.join(OUTPUT_DIR, tenant_id))
+    config.setdefault('temp_image_dir', os.path.join(TEMP_IMAGE_DIR, tenant_id))
+    return config
+
+class TenantPrefixedOutput:
+    """
+    Stands in for sys.stdout while tenants run on worker threads.
+    Every complete line printed by a thread registered with set_tenant is written as
+    "[tenant_id] line", so interleaved output from concurrent tenants stays attributable.
+    Output from other threads passes through unchanged.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    def set_tenant(self, tenant_id):
+        """Prefixes lines printed by the current thread with 'tenant_id' (None stops prefixing)."""
+        self.flush_tenant()
+        self.local.tenant_id = tenant_id
+        self.local.pending = ""
+
+    def flush_tenant(self):
+        """Writes out any unterminated line the current thread has buffered."""
+        pending = getattr(self.local, 'pending', "")
+        if pending:
+            self.local.pending = ""
+            with self.lock:
+                self.stream.write(f"[{self.local.tenant_id}] {pending}\n")
+
+    def write(self, text):
+        tenant_id = getattr(self.local, 'tenant_id', None)
+        if tenant_id is None:
+            with self.lock:
+                return self.stream.write(text)
+
+        *lines, self.local.pending = (self.local.pending + text).split("\n")
+        if lines:
+            with self.lock:
+                self.stream.write("".join(f"[{tenant_id}] {line}\n" for line in lines))
+        return len(text)
+
+    def flush(self):
+        with self.lock:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def _run_tenant(tenant, bulletin_date_str, renderer, http_sessions, resume=False, output=None):
+    """
+    Runs main_process for one tenant, turning any unexpected exception into a failed report.
+    If 'output' (a TenantPrefixedOutput) is given, the tenant's log lines are prefixed with its id.
+    """
+    if output:
+        output.set_tenant(tenant['id'])
+    try:
+        main_process(bulletin_date_str, tenant['config'], renderer, http_sessions, tenant['report'], resume)
+    except Exception as e:
+        print(f"ERROR: Unexpected failure while processing tenant '{tenant['id']}': {e}")
+        tenant['report']['status'] = 'failed'
+        tenant['report']['error'] = str(e)
+    finally:
+        if output:
+            output.set_tenant(None)
+    return tenant
+
+def print_tenant_summary(tenants):
+    """Prints one line per tenant with its status, failed stage (if any) and stage timings."""
+    print("--- Multi-config run summary ---")
+    for tenant in tenants:
+        report = tenant['report']
+        timings = ", ".join(f"{stage}={seconds:.2f}s" for stage, seconds in report.get('timings', {}).items())
+        failed_stage = f" at {report['failed_stage']}" if report.get('failed_stage') else ""
+        resumed = f" resumed past {len(report['resumed_stages'])} stage(s)" if report.get('resumed_stages') else ""
+        print(f"[{tenant['id']}] {report.get('status')}{failed_stage}{resumed} ({tenant['config_path']}) {timings}")
+        if report.get('error'):
+            print(f"[{tenant['id']}]   error: {report['error']}")
+
+def run_multi_tenant(bulletin_date_str, config_paths, max_workers=None, resume=False):
+    """
+    Generates the bulletin for several church configs concurrently in one process.
+    All tenants share one renderer and one HTTP session (connection pool) per PocketBase URL.
+    Unless a config sets 'output_dir' / 'temp_image_dir', each tenant writes to
+    OUTPUT_DIR/<tenant_id> and TEMP_IMAGE_DIR/<tenant_id>, so PDFs, cover images and
+    upload outboxes never collide. A failing tenant does not affect the others.
+    With 'resume', each tenant resumes from its own run journal (see main_process).
+    Returns the list of tenants, each with its 'id', 'config_path', 'config' and 'report'.
+    """
+    tenants = []
+    seen_ids = set()
+    for config_path in config_paths:
+        report = {'status': 'failed', 'failed_stage': None, 'error': None, 'timings': {}}
+        config = load_config(config_path)
+        if not config:
+            report.update({'failed_stage': 'load_config', 'error': "Configuration loading failed."})
+            tenants.append({'id': os.path.basename(config_path), 'config_path': config_path, 'config': None, 'report': report})
+            continue
+
+        tenant_id = get_tenant_id(config, config_path)
+        if tenant_id in seen_ids:
+            report.update({'failed_stage': 'load_config', 'error': f"Duplicate tenant id '{tenant_id}'. Set a unique 'tenant_id' in the config."})
+            tenants.append({'id': tenant_id, 'config_path': config_path, 'config': None, 'report': report})
+            continue
+        seen_ids.add(tenant_id)
+
+        apply_tenant_dirs(config, tenant_id)
+        tenants.append({'id': tenant_id, 'config_path': config_path, 'config': config, 'report': report})
+
+    runnable = [tenant for tenant in tenants if tenant['config']]
+    if not runnable:
+        print("ERROR: No usable configuration files were provided.")
+        print_tenant_summary(tenants)
+        return tenants
+
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    max_workers = max_workers or min(len(runnable), 4)
+
+    renderer = create_renderer()
+    if not renderer:
+        print("WARNING: Shared renderer could not be initialized. Each tenant will render independently.")
+
+    http_sessions = {}
+    for tenant in runnable:
+        pocketbase_url = str(tenant['config'].get('pocketbase_url', '')).rstrip('/')
+        if pocketbase_url and pocketbase_url not in http_sessions:
+            http_sessions[pocketbase_url] = create_http_session(pool_size=max_workers)
+
+    print(f"Processing {len(runnable)} config(s) with {max_workers} worker(s) across {len(http_sessions)} PocketBase host(s)...")
+    original_stdout = sys.stdout
+    tenant_output = TenantPrefixedOutput(original_stdout)
+    sys.stdout = tenant_output
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_run_tenant, tenant, bulletin_date_str, renderer, http_sessions, resume, tenant_output)
+                for tenant in runnable
+            ]
+            concurrent.futures.wait(futures)
+    finally:
+        sys.stdout = original_stdout
+        for session in http_sessions.values():
+            session.close()
+
+    print_tenant_summary(tenants)
+    return tenants
+
+def positive_int(value):
+    """argparse type for options that need a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a whole number")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 if __name__ == "__main__":
@@ -721,10 +1853,71 @@ if __name__ == "__main__":
         type=str, 
         help="Optional: Specific date for the bulletin in YYYY-MM-DD format. Defaults to the upcoming Saturday (or today if it is Saturday)."
     )
+    parser.add_argument(
+        "--config",
+        action="append",
+        metavar="PATH",
+        help="Optional: Path to a config.toml. Repeat to generate bulletins for several churches in one run. Defaults to config.toml next to main.py."
+    )
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        help="Optional: Number of configs processed concurrently when several --config files are given. Defaults to min(number of configs, 4)."
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Optional: Resume the run for this date from its journal, skipping stages that already completed."
+    )
+    parser.add_argument(
+        "--search",
+        metavar="QUERY",
+        help="Search the archive of past bulletins (e.g., a speaker or hymn title) instead of generating a bulletin."
+    )
+    parser.add_argument(
+        "--search-type",
+        metavar="TYPE",
+        help="Optional: Restrict --search to one item type, e.g. Sermon, Hymn, 'Scripture Reading', 'Special Music' or 'Sabbath School'."
+    )
+    parser.add_argument(
+        "--limit",
+        type=positive_int,
+        default=20,
+        help="Optional: Maximum number of --search results per config. Defaults to 20."
+    )
+    parser.add_argument(
+        "--backfill-archive",
+        action="store_true",
+        help="Index every bulletin in PocketBase into the search archive instead of generating a bulletin."
+    )
     
     args = parser.parse_args()
     target_bulletin_date_str = None
 
+    if args.search or args.backfill_archive:
+        archive_success = True
+        for config_path in (args.config or [None]):
+            config = load_config(config_path)
+            if not config:
+                archive_success = False
+                continue
+            if args.config and len(args.config) > 1:
+                # Same per-tenant directories as a multi-config generation run
+                tenant_id = get_tenant_id(config, config_path)
+                apply_tenant_dirs(config, tenant_id)
+                print(f"--- Archive for tenant: {tenant_id} ---")
+            if args.backfill_archive:
+                archive_success = backfill_archive(config) and archive_success
+            if args.search:
+                search_started = time.perf_counter()
+                results = search_archive(get_archive_db_path(config), args.search, args.search_type, args.limit)
+                if results is None:
+                    archive_success = False
+                    continue
+                print_archive_results(results)
+                print(f"{len(results)} result(s) in {(time.perf_counter() - search_started) * 1000:.1f} ms")
+        exit(0 if archive_success else 1)
+
     if args.date:
         try:
             # Validate the provided date format
@@ -747,8 +1940,16 @@ if __name__ == "__main__":
             print(f"No date provided. Automatically determined upcoming Saturday: {target_bulletin_date.strftime('%Y-%m-%d')}")
         target_bulletin_date_str = target_bulletin_date.strftime("%Y-%m-%d")
 
-    if target_bulletin_date_str:
-        main_process(target_bulletin_date_str)
+    if target_bulletin_date_str and args.config and len(args.config) > 1:
+        tenants = run_multi_tenant(target_bulletin_date_str, args.config, args.workers, args.resume)
+        if any(tenant['report'].get('status') == 'failed' for tenant in tenants):
+            exit(1)
+    elif target_bulletin_date_str:
+        config = load_config(args.config[0]) if args.config else None
+        if args.config and not config:
+            exit(1)
+        if not main_process(target_bulletin_date_str, config, resume=args.resume):
+            exit(1)
     else:
         # This case should not be reached if logic is correct, but as a safeguard:
         print("ERROR: Could not determine target bulletin date.")